@@ -4,6 +4,15 @@ Main generator script for all scrapers
 Run: python scripts/generate_all.py [scraper_type]
 Example: python scripts/generate_all.py stackoverflow
          python scripts/generate_all.py github
+
+Offline runs (see src/utils/transport.py), SCRAPER_SEED must match:
+  SCRAPER_TRANSPORT=record SCRAPER_SEED=42 python scripts/generate_all.py github
+  SCRAPER_TRANSPORT=replay SCRAPER_SEED=42 python scripts/generate_all.py github
+
+Output mode (SVG_OUTPUT):
+  plain       indented SVG (default)
+  minified    minified SVG
+  compressed  minified SVG + .svg.gz / .svg.br siblings
 """
 import os
 import sys
@@ -14,6 +23,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.services import StackOverflowScraper, GitHubRepoScraper
 from src.generators import StackOverflowSVGGenerator, GitHubRepoSVGGenerator
+from src.utils.transport import (
+    Transport,
+    TransportError,
+    derive_seed,
+    seed_from_env,
+    transport_from_env
+)
+from src.utils.svg import write_svg
 
 
 SCRAPERS = {
@@ -29,21 +46,40 @@ SCRAPERS = {
     }
 }
 
+OUTPUT_MODES = ("plain", "minified", "compressed")
+
+
+def generate_svg(
+    scraper_type: str = "stackoverflow",
+    transport: Transport = None,
+    seed: int = None,
+    output_mode: str = "plain"
+):
+    """Generate SVG for given scraper type
 
-def generate_svg(scraper_type: str = "stackoverflow"):
-    """Generate SVG for given scraper type"""
+    Args:
+        scraper_type: Key in SCRAPERS
+        transport: HTTP transport passed to the scraper (live by default)
+        seed: Seed for scraper random choices
+        output_mode: One of OUTPUT_MODES
+    """
     if scraper_type not in SCRAPERS:
         print(f"❌ Unknown scraper type: {scraper_type}")
         print(f"Available types: {', '.join(SCRAPERS.keys())}")
         return False
     
+    if output_mode not in OUTPUT_MODES:
+        print(f"❌ Unknown output mode: {output_mode}")
+        print(f"Available modes: {', '.join(OUTPUT_MODES)}")
+        return False
+    
     config = SCRAPERS[scraper_type]
     scraper_class = config["scraper"]
     generator_class = config["generator"]
     output_file = config["output_file"]
     
     print(f"🔄 Fetching from {scraper_type}...")
-    scraper = scraper_class()
+    scraper = scraper_class(transport=transport, seed=seed)
     item = scraper.fetch()
     
     if not item:
@@ -53,16 +89,15 @@ def generate_svg(scraper_type: str = "stackoverflow"):
     print(f"✅ Fetched: {item.get('title', 'N/A')[:50]}...")
     
     print(f"🎨 Generating SVG...")
-    generator = generator_class()
+    generator = generator_class(minify=output_mode != "plain")
     svg_content = generator.generate(item)
     
     # Save SVG
     os.makedirs("assets", exist_ok=True)
     output_path = os.path.join("assets", output_file)
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(svg_content)
+    written = write_svg(output_path, svg_content, precompress=output_mode == "compressed")
     
-    print(f"✅ Saved to: {output_path}")
+    print(f"✅ Saved to: {', '.join(written)}")
     return True
 
 
@@ -72,7 +107,21 @@ def main():
     else:
         scraper_type = "stackoverflow"
     
-    generate_svg(scraper_type)
+    try:
+        seed = seed_from_env()
+        transport = transport_from_env(seed=derive_seed(seed))
+    except (TransportError, ValueError) as e:
+        print(f"❌ Invalid transport setup: {e}")
+        return False
+    
+    # Closing the transport flushes recorded responses to the archive
+    with transport:
+        return generate_svg(
+            scraper_type,
+            transport=transport,
+            seed=seed,
+            output_mode=os.environ.get("SVG_OUTPUT", "plain")
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Serve generated SVG badges locally
+Picks .svg.br / .svg.gz / .svg variant based on Accept-Encoding
+Run: python scripts/serve_assets.py [port]
+"""
+import os
+import sys
+from http.server import HTTPServer, SimpleHTTPRequestHandler
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.svg import negotiate_encoding
+
+
+ASSETS_DIR = "assets"
+
+
+class AssetHandler(SimpleHTTPRequestHandler):
+    """Static handler serving precompressed SVG siblings when accepted"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=ASSETS_DIR, **kwargs)
+
+    def do_GET(self):
+        if not self._send_svg(head_only=False):
+            super().do_GET()
+
+    def do_HEAD(self):
+        if not self._send_svg(head_only=True):
+            super().do_HEAD()
+
+    def _send_svg(self, head_only: bool) -> bool:
+        """Send negotiated SVG variant; False if path is not an SVG badge"""
+        path = self.translate_path(self.path)
+        if not path.endswith(".svg") or not os.path.isfile(path):
+            return False
+
+        variant, encoding = negotiate_encoding(self.headers.get("Accept-Encoding", ""), path)
+        with open(variant, "rb") as f:
+            data = f.read()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "image/svg+xml")
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Vary", "Accept-Encoding")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.end_headers()
+        if not head_only:
+            self.wfile.write(data)
+        return True
+
+
+def main():
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8000
+    server = HTTPServer(("127.0.0.1", port), AssetHandler)
+    print(f"🌐 Serving {ASSETS_DIR}/ on http://127.0.0.1:{port}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,23 @@
 """Base service class for scraper services"""
+import random
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
+from src.utils.transport import Transport, LiveTransport
 
 
 class BaseScraper(ABC):
     """Abstract base class for all scraper services"""
     
-    def __init__(self, name: str):
+    def __init__(self, name: str, transport: Transport = None, seed: Optional[int] = None):
+        """
+        Args:
+            name: Scraper identifier
+            transport: HTTP transport (live by default, see src.utils.transport)
+            seed: Seed for random choices; None for non-deterministic runs
+        """
         self.name = name
+        self.transport = transport or LiveTransport()
+        self.rng = random.Random(seed)
     
     @abstractmethod
     def fetch(self) -> Optional[Dict[str, Any]]:
@@ -28,6 +38,13 @@ class BaseScraper(ABC):
 class SVGGenerator(ABC):
     """Abstract base class for SVG generators"""
     
+    def __init__(self, minify: bool = False):
+        """
+        Args:
+            minify: Emit minified SVG (see src.utils.svg.generate_svg)
+        """
+        self.minify = minify
+    
     @abstractmethod
     def generate(self, item: Dict[str, Any]) -> str:
         """Generate SVG content from item
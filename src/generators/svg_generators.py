@@ -19,7 +19,8 @@ class StackOverflowSVGGenerator(SVGGenerator):
                 "accent": "#ffb86b",
                 "text_color": "#e6eef8",
                 "link_color": "#9be7ff"
-            }
+            },
+            minify=self.minify
         )
 
 
@@ -37,5 +38,6 @@ class GitHubRepoSVGGenerator(SVGGenerator):
                 "accent": "#58a6ff",
                 "text_color": "#c9d1d9",
                 "link_color": "#79c0ff"
-            }
+            },
+            minify=self.minify
         )
@@ -1,15 +1,14 @@
 """GitHub Random Repository Scraper Service"""
-import requests
-import random
 from typing import Optional, Dict, Any
 from src.base import BaseScraper
+from src.utils.transport import Transport
 
 
 class GitHubRepoScraper(BaseScraper):
     """Scraper for random interesting GitHub repositories"""
     
-    def __init__(self):
-        super().__init__("github")
+    def __init__(self, transport: Transport = None, seed: Optional[int] = None):
+        super().__init__("github", transport=transport, seed=seed)
         self.headers = {
             "Accept": "application/vnd.github.v3+json",
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
@@ -21,10 +20,10 @@ class GitHubRepoScraper(BaseScraper):
             # Use GitHub API to search for popular repositories
             # Search for repos with stars > 1000, sort by stars
             sort_options = ["stars", "forks", "updated"]
-            sort_by = random.choice(sort_options)
+            sort_by = self.rng.choice(sort_options)
             
             # Random page to get different results
-            page = random.randint(1, 5)
+            page = self.rng.randint(1, 5)
             
             url = "https://api.github.com/search/repositories"
             params = {
@@ -35,7 +34,7 @@ class GitHubRepoScraper(BaseScraper):
                 "page": page
             }
             
-            response = requests.get(url, params=params, headers=self.headers, timeout=10)
+            response = self.transport.get(url, params=params, headers=self.headers, timeout=10)
             response.raise_for_status()
             data = response.json()
             
@@ -44,7 +43,7 @@ class GitHubRepoScraper(BaseScraper):
                 return None
             
             # Pick random repo
-            repo = random.choice(data["items"])
+            repo = self.rng.choice(data["items"])
             
             repo_name = repo.get("full_name", "Unknown")
             repo_url = repo.get("html_url", "https://github.com")
@@ -3,15 +3,20 @@ import feedparser
 from typing import Optional, Dict, Any
 from src.base import BaseScraper
 from src.utils.stupid_detector import is_stupid_question
-import random
+from src.utils.transport import Transport
 
 
 class StackOverflowScraper(BaseScraper):
     """Scraper for stupid StackOverflow questions"""
     
-    def __init__(self):
-        super().__init__("stackoverflow")
+    def __init__(self, transport: Transport = None, seed: Optional[int] = None):
+        super().__init__("stackoverflow", transport=transport, seed=seed)
         self.feed_url = "https://stackoverflow.com/feeds"
+        # Same headers feedparser sends when fetching the URL itself
+        self.headers = {
+            "Accept": feedparser.http.ACCEPT_HEADER,
+            "User-Agent": feedparser.USER_AGENT
+        }
         self.found_stupid = True  # Track if stupid question was found
     
     def looks_stupid(self, title: str) -> bool:
@@ -21,7 +26,9 @@ class StackOverflowScraper(BaseScraper):
     def fetch(self) -> Optional[Dict[str, Any]]:
         """Fetch a stupid question from StackOverflow feed"""
         try:
-            feed = feedparser.parse(self.feed_url)
+            response = self.transport.get(self.feed_url, headers=self.headers, timeout=10)
+            response.raise_for_status()
+            feed = feedparser.parse(response.content)
             if not getattr(feed, "entries", None):
                 return None
             
@@ -37,7 +44,7 @@ class StackOverflowScraper(BaseScraper):
             if not candidates:
                 print("No stupid questions found, using random fallback")
                 self.found_stupid = False
-                entry = random.choice(feed.entries)
+                entry = self.rng.choice(feed.entries)
                 return {"title": entry.title, "link": entry.link, "display_name": self.get_display_name()}
             
             self.found_stupid = True
@@ -1,7 +1,24 @@
 """SVG generation utilities"""
+import gzip
 import html
+import os
+import re
 import textwrap
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # optional (pip install Brotli), .svg.br siblings are skipped without it
+    brotli = None
+
+
+FONT_FAMILY = "Segoe UI, Roboto, Arial, sans-serif"
+
+# Precompressed sibling suffix for each Content-Encoding, in preference order
+ENCODING_SUFFIXES = {
+    "br": ".br",
+    "gzip": ".gz",
+}
 
 
 def wrap_text(text: str, width: int = 40) -> List[str]:
@@ -22,7 +39,8 @@ def generate_svg(
     max_lines: int = 6,
     line_height: int = 20,
     padding: int = 20,
-    colors: dict = None
+    colors: dict = None,
+    minify: bool = False
 ) -> str:
     """Generate SVG badge with customizable content
     
@@ -35,6 +53,7 @@ def generate_svg(
         line_height: Height of each text line
         padding: Padding around content
         colors: Dict with bg, accent, text_color, link_color keys
+        minify: Hoist shared font-family to the group and strip whitespace
     
     Returns:
         SVG string
@@ -58,6 +77,10 @@ def generate_svg(
     # Calculate height
     height = padding * 2 + line_height * (len(wrapped) + 2)
     
+    # Minified output inherits font-family from the wrapping <g>
+    font_attr = "" if minify else f'font-family="{FONT_FAMILY}" '
+    group_tag = f'<g font-family="{FONT_FAMILY}">' if minify else "<g>"
+    
     # Build SVG
     lines_svg = []
     y = padding + line_height
@@ -65,7 +88,7 @@ def generate_svg(
     # Header
     lines_svg.append(
         f'<text x="{padding}" y="{y}" font-size="18" '
-        f'font-family="Segoe UI, Roboto, Arial, sans-serif" font-weight="700" '
+        f'{font_attr}font-weight="700" '
         f'fill="{colors["accent"]}">{header_text}</text>'
     )
     y += line_height + 6
@@ -74,7 +97,7 @@ def generate_svg(
     for ln in wrapped:
         lines_svg.append(
             f'<text x="{padding}" y="{y}" font-size="16" '
-            f'font-family="Segoe UI, Roboto, Arial, sans-serif" '
+            f'{font_attr}'
             f'fill="{colors["text_color"]}">{ln}</text>'
         )
         y += line_height
@@ -86,7 +109,7 @@ def generate_svg(
     y += 6
     lines_svg.append(
         f'<a href="{link}"><text x="{padding}" y="{y}" font-size="13" '
-        f'font-family="Segoe UI, Roboto, Arial, sans-serif" '
+        f'{font_attr}'
         f'fill="{colors["link_color"]}">{display_link}</text></a>'
     )
     
@@ -97,9 +120,98 @@ def generate_svg(
     </filter>
   </defs>
   <rect width="100%" height="100%" rx="12" fill="{colors["bg"]}" filter="url(#shadow)"/>
-  <g>
+  {group_tag}
     {"".join(lines_svg)}
   </g>
   <rect x="0" y="{height-28}" width="{width}" height="28" fill-opacity="0"/>
 </svg>'''
+    if minify:
+        svg = minify_svg(svg)
     return svg
+
+
+def minify_svg(svg: str) -> str:
+    """Strip whitespace-only runs between tags; text content is left as is"""
+    return re.sub(r">\s+<", "><", svg).strip()
+
+
+def write_svg(path: str, svg: str, precompress: bool = False) -> List[str]:
+    """Write SVG file, optionally with .svg.gz and .svg.br siblings
+    
+    Args:
+        path: Output .svg path
+        svg: SVG content
+        precompress: Also write precompressed siblings for static hosting
+    
+    Returns:
+        List of written paths
+    
+    Siblings that are not written this time are removed, so stale
+    compressed badges are never served next to a newer .svg.
+    """
+    data = svg.encode("utf-8")
+    written = [path]
+    with open(path, "wb") as f:
+        f.write(data)
+    
+    if precompress:
+        # mtime=0 keeps .gz output identical across runs with the same content
+        with open(path + ENCODING_SUFFIXES["gzip"], "wb") as f:
+            f.write(gzip.compress(data, compresslevel=9, mtime=0))
+        written.append(path + ENCODING_SUFFIXES["gzip"])
+        
+        if brotli is not None:
+            with open(path + ENCODING_SUFFIXES["br"], "wb") as f:
+                f.write(brotli.compress(data, mode=brotli.MODE_TEXT, quality=11))
+            written.append(path + ENCODING_SUFFIXES["br"])
+        else:
+            print("⚠️ brotli not installed, skipping .br output")
+    
+    for suffix in ENCODING_SUFFIXES.values():
+        sibling = path + suffix
+        if sibling not in written and os.path.exists(sibling):
+            os.remove(sibling)
+    
+    return written
+
+
+def negotiate_encoding(accept_encoding: str, path: str) -> Tuple[str, Optional[str]]:
+    """Pick best precompressed variant of path for an Accept-Encoding header
+    
+    Args:
+        accept_encoding: Raw Accept-Encoding request header
+        path: Plain .svg path
+    
+    Relies on write_svg removing siblings it did not write, so any existing
+    sibling matches the current .svg.
+    
+    Returns:
+        (file path to serve, Content-Encoding or None for identity)
+    """
+    accepted = {}
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        match = re.search(r"q\s*=\s*([0-9.]+)", params)
+        if match:
+            try:
+                q = float(match.group(1))
+            except ValueError:
+                q = 0.0
+        accepted[coding] = q
+    
+    wildcard = accepted.get("*", 0.0)
+    candidates = []
+    for order, (encoding, suffix) in enumerate(ENCODING_SUFFIXES.items()):
+        q = accepted.get(encoding, wildcard)
+        variant = path + suffix
+        if q > 0 and os.path.exists(variant):
+            candidates.append((-q, order, encoding, variant))
+    
+    if not candidates:
+        return path, None
+    _, _, encoding, variant = min(candidates)
+    return variant, encoding
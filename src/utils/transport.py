@@ -0,0 +1,317 @@
+"""HTTP transports for scraper services
+
+Scrapers talk to the network through a transport instead of calling
+``requests`` directly, so runs can be recorded once and replayed offline:
+
+- ``LiveTransport``: plain HTTP via ``requests`` (default)
+- ``RecordingTransport``: live HTTP, every response saved to an archive
+- ``ReplayTransport``: serves responses from an archive, with optional
+  latency and error injection
+
+Requests are matched by URL + query params. Scrapers pick params with their
+seeded RNG, so record and replay must use the same scraper seed (see
+seed_from_env) unless replay runs with match="url".
+"""
+import base64
+import gzip
+import json
+import os
+import random
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+
+import requests
+
+
+# Scraper seed used for record/replay runs when SCRAPER_SEED is unset
+DEFAULT_FIXTURE_SEED = 0
+
+
+class TransportError(Exception):
+    """Raised when a transport cannot produce a response"""
+
+
+class TransportResponse:
+    """Minimal response object shared by all transports"""
+
+    def __init__(self, url: str, status_code: int, content: bytes, headers: Dict[str, str] = None):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    @property
+    def text(self) -> str:
+        """Response body decoded as UTF-8"""
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        """Response body parsed as JSON"""
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        """Raise TransportError for 4xx/5xx responses"""
+        if self.status_code >= 400:
+            raise TransportError(f"HTTP {self.status_code} for {self.url}")
+
+
+def request_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Build archive key for a request (URL + sorted query params)"""
+    if not params:
+        return url
+    return f"{url}?{urlencode(sorted(params.items()))}"
+
+
+class Transport(ABC):
+    """Abstract base class for all transports"""
+
+    @abstractmethod
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 10
+    ) -> TransportResponse:
+        """Perform GET request
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            headers: Request headers
+            timeout: Timeout in seconds
+
+        Returns:
+            TransportResponse
+        """
+        pass
+
+    def close(self):
+        """Release resources / flush pending data (no-op by default)"""
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class LiveTransport(Transport):
+    """Transport doing real HTTP requests"""
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 10
+    ) -> TransportResponse:
+        response = requests.get(url, params=params, headers=headers, timeout=timeout)
+        return TransportResponse(
+            url=url,
+            status_code=response.status_code,
+            content=response.content,
+            headers={"Content-Type": response.headers.get("Content-Type", "")}
+        )
+
+
+class FixtureArchive:
+    """Compact on-disk archive of recorded responses (gzipped JSON)
+
+    Layout: {"<request key>": {"url", "status", "headers", "body"}}
+    where body is the raw response content, base64-encoded
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        if self.path.exists():
+            self.load()
+
+    def load(self):
+        """Load entries from disk"""
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            self.entries = json.load(f)
+
+    def save(self):
+        """Write entries to disk"""
+        os.makedirs(self.path.parent, exist_ok=True)
+        with gzip.open(self.path, "wt", encoding="utf-8") as f:
+            json.dump(self.entries, f, separators=(",", ":"), sort_keys=True)
+
+    def put(self, key: str, response: TransportResponse):
+        """Store response under key"""
+        self.entries[key] = {
+            "url": response.url,
+            "status": response.status_code,
+            "headers": response.headers,
+            "body": base64.b64encode(response.content).decode("ascii")
+        }
+
+    def get(self, key: str, url: str, match: str = "exact") -> Optional[TransportResponse]:
+        """Find response for key
+
+        Args:
+            key: Request key (see request_key)
+            url: Request URL without query params
+            match: "exact" (key only) or "url" (fall back to any entry with same URL)
+        """
+        entry = self.entries.get(key)
+        if entry is None and match == "url":
+            entry = next((e for e in self.entries.values() if e["url"] == url), None)
+        if entry is None:
+            return None
+        return TransportResponse(
+            url=entry["url"],
+            status_code=entry["status"],
+            content=base64.b64decode(entry["body"]),
+            headers=entry["headers"]
+        )
+
+
+class RecordingTransport(Transport):
+    """Live transport that saves every response to an archive
+
+    Responses are kept in memory and written on close(); use as a context
+    manager or call close() once the run is done.
+    """
+
+    def __init__(self, archive_path: str, inner: Transport = None):
+        self.archive = FixtureArchive(archive_path)
+        self.inner = inner or LiveTransport()
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 10
+    ) -> TransportResponse:
+        response = self.inner.get(url, params=params, headers=headers, timeout=timeout)
+        self.archive.put(request_key(url, params), response)
+        return response
+
+    def close(self):
+        """Write recorded responses to disk"""
+        self.archive.save()
+
+
+class ReplayTransport(Transport):
+    """Transport serving recorded responses without touching the network"""
+
+    def __init__(
+        self,
+        archive_path: str,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        seed: Optional[int] = None,
+        match: str = "exact"
+    ):
+        """
+        Args:
+            archive_path: Archive written by RecordingTransport
+            latency: Base delay per request in seconds
+            jitter: Max extra random delay in seconds
+            error_rate: Probability (0-1) of raising TransportError
+            seed: Seed for latency/error RNG
+            match: "exact" to require the same URL and params as recorded,
+                "url" to accept any response recorded for the same URL
+        """
+        if match not in ("exact", "url"):
+            raise ValueError(f"Unknown match mode: {match}")
+        self.archive = FixtureArchive(archive_path)
+        if not self.archive.entries:
+            raise TransportError(f"Fixture archive is empty or missing: {archive_path}")
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.match = match
+        self.rng = random.Random(seed)
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 10
+    ) -> TransportResponse:
+        delay = self.latency + self.rng.uniform(0, self.jitter)
+        if delay > timeout:
+            time.sleep(timeout)
+            raise TransportError(f"Timed out after {timeout}s for {url}")
+        if delay > 0:
+            time.sleep(delay)
+        if self.rng.random() < self.error_rate:
+            raise TransportError(f"Injected error for {url}")
+
+        response = self.archive.get(request_key(url, params), url, match=self.match)
+        if response is None:
+            raise TransportError(
+                f"No recorded response for {request_key(url, params)} "
+                "(record and replay with the same SCRAPER_SEED, or use SCRAPER_MATCH=url)"
+            )
+        return response
+
+
+def transport_from_env(seed: Optional[int] = None) -> Transport:
+    """Build transport from environment variables
+
+    SCRAPER_TRANSPORT: live (default), record or replay
+    SCRAPER_FIXTURES: archive path (default: fixtures/responses.json.gz)
+    SCRAPER_LATENCY, SCRAPER_JITTER, SCRAPER_ERROR_RATE: replay tuning
+    SCRAPER_MATCH: replay matching, exact (default) or url
+
+    Args:
+        seed: Seed for replay latency/error RNG; pass one independent from
+            the scraper seed (see derive_seed)
+    """
+    mode = os.environ.get("SCRAPER_TRANSPORT", "live")
+    archive_path = os.environ.get("SCRAPER_FIXTURES", "fixtures/responses.json.gz")
+
+    if mode == "live":
+        return LiveTransport()
+    if mode == "record":
+        return RecordingTransport(archive_path)
+    if mode == "replay":
+        return ReplayTransport(
+            archive_path,
+            latency=float(os.environ.get("SCRAPER_LATENCY", 0)),
+            jitter=float(os.environ.get("SCRAPER_JITTER", 0)),
+            error_rate=float(os.environ.get("SCRAPER_ERROR_RATE", 0)),
+            seed=seed,
+            match=os.environ.get("SCRAPER_MATCH", "exact")
+        )
+    raise ValueError(f"Unknown SCRAPER_TRANSPORT: {mode}")
+
+
+def seed_from_env() -> Optional[int]:
+    """Read scraper seed from SCRAPER_SEED
+
+    Record/replay runs fall back to DEFAULT_FIXTURE_SEED so that an unseeded
+    recording can be replayed unseeded; live runs stay non-deterministic.
+
+    Raises:
+        ValueError: SCRAPER_SEED is not an integer
+    """
+    seed = os.environ.get("SCRAPER_SEED")
+    if seed is not None:
+        return int(seed)
+    if os.environ.get("SCRAPER_TRANSPORT", "live") in ("record", "replay"):
+        return DEFAULT_FIXTURE_SEED
+    return None
+
+
+def derive_seed(seed: Optional[int]) -> Optional[int]:
+    """Derive independent transport seed from a scraper seed
+
+    Keeps injected latency/errors from mirroring the scraper's own random
+    choices when both are driven by one SCRAPER_SEED.
+    """
+    if seed is None:
+        return None
+    return random.Random(seed).getrandbits(32)
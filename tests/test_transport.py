@@ -0,0 +1,164 @@
+"""Tests for record/replay transports"""
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services import GitHubRepoScraper
+from src.utils import transport as transport_module
+from src.utils.transport import (
+    RecordingTransport,
+    ReplayTransport,
+    Transport,
+    TransportError,
+    TransportResponse,
+    derive_seed,
+    seed_from_env
+)
+
+
+class FakeTransport(Transport):
+    """Inner transport returning one repo named after the request params"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, url, params=None, headers=None, timeout=10):
+        self.calls += 1
+        params = params or {}
+        items = [{
+            "full_name": f"{params.get('sort')}/{params.get('page')}",
+            "html_url": "https://github.com/fake"
+        }]
+        return TransportResponse(url, 200, json.dumps({"items": items}).encode("utf-8"))
+
+
+@pytest.fixture
+def archive(tmp_path):
+    return str(tmp_path / "fixtures.json.gz")
+
+
+def record(archive, seed):
+    with RecordingTransport(archive, inner=FakeTransport()) as recorder:
+        return GitHubRepoScraper(transport=recorder, seed=seed).fetch()
+
+
+def test_transport_is_abstract():
+    with pytest.raises(TypeError):
+        Transport()
+
+
+def test_recording_saves_on_close(archive):
+    recorder = RecordingTransport(archive, inner=FakeTransport())
+    recorder.get("https://example.com")
+    assert not Path(archive).exists()
+    recorder.close()
+    assert Path(archive).exists()
+
+
+def test_archive_round_trip_is_lossless(archive):
+    body = "café".encode("latin-1") + bytes(range(256))
+
+    class BinaryTransport(Transport):
+        def get(self, url, params=None, headers=None, timeout=10):
+            return TransportResponse(url, 200, body, {"Content-Type": "application/octet-stream"})
+
+    with RecordingTransport(archive, inner=BinaryTransport()) as recorder:
+        recorder.get("https://example.com/bin")
+
+    response = ReplayTransport(archive).get("https://example.com/bin")
+    assert response.content == body
+    assert response.headers == {"Content-Type": "application/octet-stream"}
+
+
+def test_replay_same_seed_matches_record(archive):
+    recorded = record(archive, seed=42)
+    replayed = GitHubRepoScraper(transport=ReplayTransport(archive), seed=42).fetch()
+    assert replayed == recorded
+
+
+def test_replay_exact_match_rejects_other_params(archive):
+    record(archive, seed=1)
+    replay = ReplayTransport(archive)
+    with pytest.raises(TransportError, match="No recorded response"):
+        replay.get("https://api.github.com/search/repositories", params={"page": 99})
+
+
+def test_replay_url_match_falls_back(archive):
+    recorded = record(archive, seed=1)
+    replay = ReplayTransport(archive, match="url")
+    response = replay.get("https://api.github.com/search/repositories", params={"page": 99})
+    assert response.json()["items"][0]["full_name"] == recorded["repo_name"]
+
+
+def test_replay_missing_archive(archive):
+    with pytest.raises(TransportError):
+        ReplayTransport(archive)
+
+
+def test_replay_same_seed_same_injection(archive, monkeypatch):
+    record(archive, seed=1)
+    url = "https://api.github.com/search/repositories"
+
+    def run(seed):
+        sleeps = []
+        monkeypatch.setattr(transport_module.time, "sleep", sleeps.append)
+        replay = ReplayTransport(archive, latency=0.01, jitter=0.05, error_rate=0.5, seed=seed, match="url")
+        outcomes = []
+        for _ in range(20):
+            try:
+                replay.get(url)
+                outcomes.append("ok")
+            except TransportError:
+                outcomes.append("error")
+        return sleeps, outcomes
+
+    first = run(7)
+    assert first == run(7)
+    assert "ok" in first[1] and "error" in first[1]
+
+
+def test_replay_timeout(archive, monkeypatch):
+    record(archive, seed=1)
+    sleeps = []
+    monkeypatch.setattr(transport_module.time, "sleep", sleeps.append)
+    replay = ReplayTransport(archive, latency=5, match="url")
+    with pytest.raises(TransportError, match="Timed out"):
+        replay.get("https://api.github.com/search/repositories", timeout=1)
+    assert sleeps == [1]
+
+
+def test_seed_from_env(monkeypatch):
+    monkeypatch.delenv("SCRAPER_SEED", raising=False)
+    monkeypatch.delenv("SCRAPER_TRANSPORT", raising=False)
+    assert seed_from_env() is None
+
+    monkeypatch.setenv("SCRAPER_TRANSPORT", "record")
+    assert seed_from_env() == transport_module.DEFAULT_FIXTURE_SEED
+
+    monkeypatch.setenv("SCRAPER_SEED", "42")
+    assert seed_from_env() == 42
+
+    monkeypatch.setenv("SCRAPER_SEED", "abc")
+    with pytest.raises(ValueError):
+        seed_from_env()
+
+
+def test_unseeded_record_replays_with_default_seed(archive, monkeypatch):
+    monkeypatch.delenv("SCRAPER_SEED", raising=False)
+    monkeypatch.setenv("SCRAPER_TRANSPORT", "record")
+    recorded = record(archive, seed=seed_from_env())
+
+    monkeypatch.setenv("SCRAPER_TRANSPORT", "replay")
+    replay = ReplayTransport(archive, seed=derive_seed(seed_from_env()))
+    assert GitHubRepoScraper(transport=replay, seed=seed_from_env()).fetch() == recorded
+
+
+def test_derive_seed_differs_from_scraper_seed():
+    assert derive_seed(None) is None
+    assert derive_seed(42) == derive_seed(42)
+    assert derive_seed(42) != 42